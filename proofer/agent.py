@@ -1,6 +1,6 @@
 import difflib
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 from rich.prompt import Confirm
 from langgraph.graph import StateGraph
 
@@ -11,7 +11,8 @@ from proofer.display import (
     display_line_diff,
 )
 from proofer.diff import find_word_changes
-from proofer.config import client, console
+from proofer.backends import DEFAULT_MODEL, LLMBackend
+from proofer.config import console, get_backend, get_model
 
 
 def load_file_node(state: AgentState) -> AgentState:
@@ -23,9 +24,11 @@ def load_file_node(state: AgentState) -> AgentState:
     return {**state, "original_text": text}
 
 
-def call_openai_node(state: AgentState) -> AgentState:
-    response = client.chat.completions.create(
-        model="gpt-4o",
+def call_llm_node(
+    state: AgentState, backend: LLMBackend, model: str = DEFAULT_MODEL
+) -> AgentState:
+    suggestions = backend.complete(
+        model=model,
         messages=[
             {
                 "role": "system",
@@ -44,7 +47,6 @@ def call_openai_node(state: AgentState) -> AgentState:
         ],
         temperature=0,
     )
-    suggestions = response.choices[0].message.content
     original_text = state["original_text"]
 
     has_corrections = has_spelling_corrections(original_text, suggestions)
@@ -124,10 +126,18 @@ def route_after_llm(state: AgentState) -> str:
         return "no_corrections"
 
 
-def build_graph() -> Any:
+def build_graph(
+    backend: Optional[LLMBackend] = None, model: Optional[str] = None
+) -> Any:
+    backend = backend or get_backend()
+    model = get_model(model)
+
+    def call_llm(state: AgentState) -> AgentState:
+        return call_llm_node(state, backend, model)
+
     graph = StateGraph(AgentState)
     graph.add_node("load_file", load_file_node)
-    graph.add_node("call_llm", call_openai_node)
+    graph.add_node("call_llm", call_llm)
     graph.add_node("diff", compute_diff_node)
     graph.add_node("print", print_diff_node)
     graph.add_node("approve", approve_changes_node)
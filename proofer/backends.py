@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional, Protocol, Union
+from openai import OpenAI
+
+DEFAULT_MODEL = "gpt-4o"
+BACKEND_NAMES = ("openai", "record", "replay")
+
+
+class LLMBackend(Protocol):
+    def complete(
+        self, messages: list[dict[str, str]], model: str, temperature: float
+    ) -> str:
+        """Return the assistant message content for a chat completion request."""
+        ...
+
+
+class OpenAIBackend:
+    """Chat completions via the OpenAI API or any OpenAI-compatible server."""
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+        # local inference servers usually ignore the key but the client requires one
+        if base_url:
+            api_key = api_key or os.environ.get("OPENAI_API_KEY") or "not-needed"
+        self.client = OpenAI(base_url=base_url, api_key=api_key)
+
+    def complete(
+        self, messages: list[dict[str, str]], model: str, temperature: float
+    ) -> str:
+        response = self.client.chat.completions.create(
+            model=model, messages=messages, temperature=temperature
+        )
+        return response.choices[0].message.content or ""
+
+
+class RecordingNotFoundError(FileNotFoundError):
+    """Raised in replay mode when no response was recorded for a request."""
+
+
+class RecordReplayBackend:
+    """Save request/response pairs to disk and serve them back without a network call.
+
+    In record mode every request is forwarded to the wrapped backend and the
+    response is written to `cassette_dir`. In replay mode responses are read
+    back from `cassette_dir` and a missing recording is an error.
+
+    Recordings are keyed by model, messages and temperature only, so keep
+    recordings from different endpoints in separate directories.
+    """
+
+    def __init__(
+        self,
+        cassette_dir: Union[str, Path],
+        inner: Optional[LLMBackend] = None,
+        record: bool = False,
+    ):
+        if record and inner is None:
+            raise ValueError("Recording requires a backend to forward requests to")
+        self.cassette_dir = Path(cassette_dir)
+        self.inner = inner
+        self.record = record
+
+    @staticmethod
+    def request_key(
+        messages: list[dict[str, str]], model: str, temperature: float
+    ) -> str:
+        """Stable hash identifying a request."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": float(temperature),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def cassette_path(
+        self, messages: list[dict[str, str]], model: str, temperature: float
+    ) -> Path:
+        key = self.request_key(messages, model, temperature)
+        return self.cassette_dir / f"{key}.json"
+
+    def complete(
+        self, messages: list[dict[str, str]], model: str, temperature: float
+    ) -> str:
+        path = self.cassette_path(messages, model, temperature)
+
+        if not self.record:
+            if not path.exists():
+                raise RecordingNotFoundError(f"No recorded response for request: {path}")
+            return json.loads(path.read_text(encoding="utf-8"))["response"]
+
+        content = self.inner.complete(messages, model, temperature)
+        self.cassette_dir.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "request": {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+            },
+            "response": content,
+        }
+        path.write_text(json.dumps(entry, indent=2) + "\n", encoding="utf-8")
+        return content
+
+
+def create_backend(
+    name: str = "openai",
+    base_url: Optional[str] = None,
+    cassette_dir: Optional[Union[str, Path]] = None,
+) -> LLMBackend:
+    """Build a backend by name: "openai", "record" or "replay"."""
+    if name == "openai":
+        return OpenAIBackend(base_url=base_url)
+
+    if name in ("record", "replay"):
+        if not cassette_dir:
+            raise ValueError(f"The {name} backend requires a cassette directory")
+        if name == "replay":
+            return RecordReplayBackend(cassette_dir)
+        return RecordReplayBackend(
+            cassette_dir, inner=OpenAIBackend(base_url=base_url), record=True
+        )
+
+    raise ValueError(
+        f"Unknown backend {name!r}, expected one of: {', '.join(BACKEND_NAMES)}"
+    )
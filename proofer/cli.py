@@ -1,6 +1,8 @@
 import click
 
 from proofer.agent import build_graph
+from proofer.backends import BACKEND_NAMES, RecordingNotFoundError
+from proofer.config import get_backend
 from proofer.state import AgentState
 
 
@@ -10,18 +12,46 @@ from proofer.state import AgentState
 @click.option(
     "--yes", is_flag=True, help="Automatically approve and apply suggested changes."
 )
-def cli(file_path, text, yes):
+@click.option(
+    "--backend",
+    type=click.Choice(BACKEND_NAMES),
+    help="LLM backend to use (default: openai, or $PROOFER_BACKEND).",
+)
+@click.option(
+    "--base-url",
+    help="Base URL of an OpenAI-compatible server, e.g. a local inference server.",
+)
+@click.option(
+    "--model",
+    help="Model name to request (default: gpt-4o, or $PROOFER_MODEL).",
+)
+@click.option(
+    "--cassette-dir",
+    type=click.Path(file_okay=False),
+    help="Directory for recorded responses used by the record/replay backends.",
+)
+def cli(file_path, text, yes, backend, base_url, model, cassette_dir):
     if not file_path and not text:
         raise click.ClickException("Either provide a file path or use --text option")
 
     if file_path and text:
         raise click.ClickException("Cannot use both file path and --text option")
 
-    graph = build_graph()
+    try:
+        llm_backend = get_backend(backend, base_url=base_url, cassette_dir=cassette_dir)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    graph = build_graph(llm_backend, model=model)
 
     if text:
         initial_state: AgentState = {"input_text": text, "auto_approve": yes}
     else:
         initial_state: AgentState = {"path": str(file_path), "auto_approve": yes}
 
-    graph.invoke(initial_state)
+    try:
+        graph.invoke(initial_state)
+    except RecordingNotFoundError as e:
+        raise click.ClickException(
+            f"{e}. Re-run with --backend record to record a response for it."
+        )
@@ -1,5 +1,25 @@
+import os
+from typing import Optional
 from rich.console import Console
-from openai import OpenAI
 
-client = OpenAI()
+from proofer.backends import DEFAULT_MODEL, LLMBackend, create_backend
+
 console = Console()
+
+
+def get_backend(
+    name: Optional[str] = None,
+    base_url: Optional[str] = None,
+    cassette_dir: Optional[str] = None,
+) -> LLMBackend:
+    """Build the LLM backend, falling back to PROOFER_* environment variables."""
+    return create_backend(
+        name or os.environ.get("PROOFER_BACKEND", "openai"),
+        base_url=base_url or os.environ.get("PROOFER_BASE_URL"),
+        cassette_dir=cassette_dir or os.environ.get("PROOFER_CASSETTE_DIR"),
+    )
+
+
+def get_model(model: Optional[str] = None) -> str:
+    """Resolve the model name, falling back to PROOFER_MODEL and then the default."""
+    return model or os.environ.get("PROOFER_MODEL") or DEFAULT_MODEL
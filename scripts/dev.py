@@ -1,10 +1,24 @@
+import argparse
+
 from proofer.state import AgentState
 from proofer.agent import build_graph
+from proofer.backends import BACKEND_NAMES
+from proofer.config import get_backend
 
 TEST_WITHOUT_ERRORS = "./tests/files/test_without_errors.md"
 TEST_WITH_ERRORS = "./tests/files/test_with_errors.md"
 
 if __name__ == "__main__":
-    graph = build_graph()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", choices=BACKEND_NAMES)
+    parser.add_argument("--base-url")
+    parser.add_argument("--model")
+    parser.add_argument("--cassette-dir")
+    args = parser.parse_args()
+
+    backend = get_backend(
+        args.backend, base_url=args.base_url, cassette_dir=args.cassette_dir
+    )
+    graph = build_graph(backend, model=args.model)
     state: AgentState = {"path": TEST_WITH_ERRORS, "auto_approve": False}
     graph.invoke(state)
@@ -2,9 +2,16 @@ import streamlit as st
 import re
 
 from proofer.agent import build_graph
+from proofer.config import get_backend
 from proofer.diff import find_word_changes
 
 
+@st.cache_resource
+def load_backend():
+    """Build the LLM backend once and reuse it across Streamlit reruns."""
+    return get_backend()
+
+
 def display_word_changes_streamlit(changes):
     """Display word-level changes in Streamlit format."""
     if not changes:
@@ -108,7 +115,7 @@ def process_text_with_agent(text, auto_approve=False):
             "auto_approve": auto_approve,
         }
 
-        graph = build_graph()
+        graph = build_graph(load_backend())
         result = graph.invoke(initial_state)
 
         return result
@@ -0,0 +1,18 @@
+import pytest
+
+
+class FakeBackend:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def complete(self, messages, model, temperature):
+        self.calls.append(
+            {"messages": messages, "model": model, "temperature": temperature}
+        )
+        return self.response
+
+
+@pytest.fixture
+def fake_backend():
+    return FakeBackend
@@ -0,0 +1,45 @@
+from proofer.agent import build_graph, call_llm_node
+from proofer.backends import DEFAULT_MODEL
+
+
+class TestCallLLMNode:
+    def test_call_llm_node_with_corrections(self, fake_backend):
+        backend = fake_backend("Hello   \nworld\n")
+        state = {"original_text": "Helo\nwrold\n"}
+        result = call_llm_node(state, backend)
+        assert result["has_corrections"] is True
+        assert result["llm_response"] == "Hello\nworld\n"
+        assert backend.calls[0]["messages"][-1]["content"] == "Helo\nwrold\n"
+        assert backend.calls[0]["model"] == DEFAULT_MODEL
+
+    def test_call_llm_node_without_corrections(self, fake_backend):
+        state = {"original_text": "Hello world"}
+        result = call_llm_node(state, fake_backend("Hello world"))
+        assert result["has_corrections"] is False
+        assert result["llm_response"] == ""
+
+
+class TestBuildGraph:
+    def test_build_graph_uses_backend(self, fake_backend):
+        backend = fake_backend("Hello world")
+        graph = build_graph(backend)
+        result = graph.invoke(
+            {"input_text": "Helo wrold", "headless_mode": True, "auto_approve": True}
+        )
+        assert len(backend.calls) == 1
+        assert result["has_corrections"] is True
+        assert result["corrected_text"] == "Hello world"
+
+    def test_build_graph_uses_model(self, fake_backend, monkeypatch):
+        monkeypatch.setenv("PROOFER_MODEL", "from-env")
+        backend = fake_backend("Hello world")
+        graph = build_graph(backend, model="llama3.1")
+        graph.invoke({"input_text": "Hello world", "headless_mode": True})
+        assert backend.calls[0]["model"] == "llama3.1"
+
+    def test_build_graph_model_from_env(self, fake_backend, monkeypatch):
+        monkeypatch.setenv("PROOFER_MODEL", "from-env")
+        backend = fake_backend("Hello world")
+        graph = build_graph(backend)
+        graph.invoke({"input_text": "Hello world", "headless_mode": True})
+        assert backend.calls[0]["model"] == "from-env"
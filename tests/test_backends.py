@@ -0,0 +1,165 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+from proofer.backends import (
+    DEFAULT_MODEL,
+    OpenAIBackend,
+    RecordingNotFoundError,
+    RecordReplayBackend,
+    create_backend,
+)
+from proofer.cli import cli
+from proofer.config import get_backend, get_model
+
+MESSAGES = [
+    {"role": "system", "content": "Fix spelling."},
+    {"role": "user", "content": "Helo wrold"},
+]
+
+
+class TestRecordReplayBackend:
+    def test_record_then_replay(self, tmp_path, fake_backend):
+        inner = fake_backend("Hello world")
+        recorder = RecordReplayBackend(tmp_path, inner=inner, record=True)
+        assert recorder.complete(MESSAGES, "gpt-4o", 0) == "Hello world"
+        assert len(inner.calls) == 1
+
+        replayer = RecordReplayBackend(tmp_path)
+        assert replayer.complete(MESSAGES, "gpt-4o", 0) == "Hello world"
+        assert len(inner.calls) == 1
+
+    def test_record_writes_request_and_response(self, tmp_path, fake_backend):
+        recorder = RecordReplayBackend(
+            tmp_path, inner=fake_backend("Hello world"), record=True
+        )
+        recorder.complete(MESSAGES, "gpt-4o", 0)
+        files = list(tmp_path.glob("*.json"))
+        assert len(files) == 1
+        data = json.loads(files[0].read_text(encoding="utf-8"))
+        assert data["request"]["messages"] == MESSAGES
+        assert data["response"] == "Hello world"
+
+    def test_replay_missing_recording(self, tmp_path):
+        replayer = RecordReplayBackend(tmp_path)
+        with pytest.raises(RecordingNotFoundError):
+            replayer.complete(MESSAGES, "gpt-4o", 0)
+
+    @pytest.mark.parametrize(
+        "model,temperature,content",
+        [
+            ("gpt-4o-mini", 0, "Helo wrold"),
+            ("gpt-4o", 1, "Helo wrold"),
+            ("gpt-4o", 0, "Helo world"),
+        ],
+    )
+    def test_request_key_differs(self, model, temperature, content):
+        messages = [MESSAGES[0], {"role": "user", "content": content}]
+        base_key = RecordReplayBackend.request_key(MESSAGES, "gpt-4o", 0)
+        assert RecordReplayBackend.request_key(messages, model, temperature) != base_key
+
+    def test_request_key_normalizes_temperature(self):
+        assert RecordReplayBackend.request_key(
+            MESSAGES, "gpt-4o", 0
+        ) == RecordReplayBackend.request_key(MESSAGES, "gpt-4o", 0.0)
+
+    def test_record_requires_inner_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            RecordReplayBackend(tmp_path, record=True)
+
+
+class TestCreateBackend:
+    def test_create_replay_backend(self, tmp_path):
+        backend = create_backend("replay", cassette_dir=tmp_path)
+        assert isinstance(backend, RecordReplayBackend)
+        assert backend.record is False
+
+    def test_create_record_backend(self, tmp_path):
+        backend = create_backend(
+            "record", base_url="http://localhost:8000/v1", cassette_dir=tmp_path
+        )
+        assert isinstance(backend, RecordReplayBackend)
+        assert backend.record is True
+        assert isinstance(backend.inner, OpenAIBackend)
+        assert str(backend.inner.client.base_url) == "http://localhost:8000/v1/"
+
+    @pytest.mark.parametrize("name", ["record", "replay"])
+    def test_cassette_dir_required(self, name):
+        with pytest.raises(ValueError):
+            create_backend(name)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_backend("anthropic")
+
+
+class TestGetBackend:
+    def test_backend_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PROOFER_BACKEND", "replay")
+        monkeypatch.setenv("PROOFER_CASSETTE_DIR", str(tmp_path))
+        backend = get_backend()
+        assert isinstance(backend, RecordReplayBackend)
+        assert backend.cassette_dir == tmp_path
+
+    def test_base_url_from_env(self, monkeypatch):
+        monkeypatch.delenv("PROOFER_BACKEND", raising=False)
+        monkeypatch.setenv("PROOFER_BASE_URL", "http://localhost:8000/v1")
+        backend = get_backend()
+        assert isinstance(backend, OpenAIBackend)
+        assert str(backend.client.base_url) == "http://localhost:8000/v1/"
+
+    def test_arguments_override_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PROOFER_BACKEND", "openai")
+        monkeypatch.setenv("PROOFER_CASSETTE_DIR", str(tmp_path / "env"))
+        backend = get_backend("replay", cassette_dir=str(tmp_path / "arg"))
+        assert isinstance(backend, RecordReplayBackend)
+        assert backend.cassette_dir == tmp_path / "arg"
+
+    @pytest.mark.parametrize(
+        "model,env,expected",
+        [
+            (None, None, DEFAULT_MODEL),
+            (None, "from-env", "from-env"),
+            ("llama3.1", "from-env", "llama3.1"),
+        ],
+    )
+    def test_get_model(self, model, env, expected, monkeypatch):
+        if env is None:
+            monkeypatch.delenv("PROOFER_MODEL", raising=False)
+        else:
+            monkeypatch.setenv("PROOFER_MODEL", env)
+        assert get_model(model) == expected
+
+
+class TestCli:
+    def test_invalid_backend_env(self, monkeypatch):
+        monkeypatch.setenv("PROOFER_BACKEND", "anthropic")
+        result = CliRunner().invoke(cli, ["-t", "Helo"])
+        assert result.exit_code == 1
+        assert "Unknown backend 'anthropic'" in result.output
+
+    def test_cassette_dir_required(self, monkeypatch):
+        monkeypatch.delenv("PROOFER_CASSETTE_DIR", raising=False)
+        result = CliRunner().invoke(cli, ["-t", "Helo", "--backend", "replay"])
+        assert result.exit_code == 1
+        assert "requires a cassette directory" in result.output
+
+    def test_replay_missing_recording(self, tmp_path):
+        result = CliRunner().invoke(
+            cli, ["-t", "Helo", "--backend", "replay", "--cassette-dir", str(tmp_path)]
+        )
+        assert result.exit_code == 1
+        assert "No recorded response" in result.output
+        assert "--backend record" in result.output
+
+
+class TestOpenAIBackend:
+    def test_base_url_uses_env_api_key(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        backend = OpenAIBackend(base_url="http://localhost:8000/v1")
+        assert backend.client.api_key == "sk-test"
+
+    def test_base_url_without_api_key(self, monkeypatch):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        backend = OpenAIBackend(base_url="http://localhost:8000/v1")
+        assert backend.client.api_key == "not-needed"